@@ -3,43 +3,212 @@ Core game logic for Minesweeper.
 
 This module contains pure domain logic without any pygame or pixel-level
 concerns. It defines:
-- CellState: the state of a single cell
-- Cell: a cell positioned by (col,row) with an attached CellState
 - Board: grid management, mine placement, adjacency computation, reveal/flag
+- CellView: a read-only view of one cell, built on demand by Board.cell
+
+Cell state is stored as parallel 2D NumPy arrays indexed [row, col]
+(is_mine, is_revealed, is_flagged, adjacent) rather than one object per cell.
 
 The Board exposes imperative methods that the presentation layer (run.py)
 can call in response to user inputs, and does not know anything about
 rendering, timing, or input devices.
 """
 
-import random
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below also run as plain Python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+
+# (dc, dr) offsets of the 8 cells surrounding a cell
+_NEIGHBOR_DELTAS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1),
+)
+
+
+@lru_cache(maxsize=None)
+def _build_neighbor_table(cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the flat-index neighbor table for a cols x rows grid.
+
+    The first array has shape (rows*cols, 8), int32: row i lists the flat
+    indices of cell i's in-bounds neighbors first, padded with -1. The
+    second, shape (rows*cols,) uint8, holds how many entries are valid.
+    Tables are cached per grid size and shared read-only between boards.
+    """
+    r, c = np.divmod(np.arange(rows * cols, dtype=np.int32), cols)
+    table = np.full((rows * cols, 8), -1, dtype=np.int32)
+    for k, (dc, dr) in enumerate(_NEIGHBOR_DELTAS):
+        nc, nr = c + dc, r + dr
+        inbounds = (nc >= 0) & (nc < cols) & (nr >= 0) & (nr < rows)
+        table[inbounds, k] = nr[inbounds] * cols + nc[inbounds]
+    table = np.take_along_axis(table, np.argsort(table < 0, axis=1, kind="stable"), axis=1)
+    counts = (table >= 0).sum(axis=1).astype(np.uint8)
+    table.flags.writeable = False
+    counts.flags.writeable = False
+    return table, counts
+
+
+@njit("void(boolean[:, :], uint8[:, :])", cache=True)
+def _count_adjacent(is_mine, out):
+    """Write neighbor mine counts for every cell into `out` (0 on mine cells).
+
+    Sums eight shifted views of the mine grid; cells past the edge
+    contribute nothing, so no padding is needed.
+    """
+    rows, cols = is_mine.shape
+    mines = is_mine.astype(np.uint8)
+    out[:, :] = 0
+    for dr in range(-1, 2):
+        for dc in range(-1, 2):
+            if dr == 0 and dc == 0:
+                continue
+            out[max(0, -dr):rows - max(0, dr), max(0, -dc):cols - max(0, dc)] += \
+                mines[max(0, dr):rows - max(0, -dr), max(0, dc):cols - max(0, -dc)]
+    for r in range(rows):
+        for c in range(cols):
+            if is_mine[r, c]:
+                out[r, c] = 0
+
+
+@njit("int64(boolean[:, :], boolean[:, :], uint8[:, :], int64, int64)", cache=True)
+def _flood_fill(is_revealed, is_flagged, adjacent, col, row):
+    """Reveal the zero region containing (col,row) plus its numbered border.
+
+    Scanline fill: each popped seed is widened into a horizontal run of
+    unflagged zero cells, the 3-row window around the run is revealed, and
+    only the start of each zero run in the rows above and below is pushed as
+    a new seed (8-connected, so the probe spans one column past each end of
+    the run). Seeds are flat indices on a preallocated int32 stack; a cell
+    can be pushed at most twice from each neighboring row, which bounds the
+    stack size. Returns the number of newly revealed cells.
+    """
+    rows, cols = adjacent.shape
+    expanded = np.zeros((rows, cols), dtype=np.bool_)
+    stack = np.empty(4 * rows * cols + 1, dtype=np.int32)
+    stack[0] = row * cols + col
+    top = 1
+    revealed = 0
+    while top > 0:
+        top -= 1
+        r = stack[top] // cols
+        c = stack[top] - r * cols
+        if adjacent[r, c] != 0 or is_flagged[r, c] or expanded[r, c]:
+            continue
+        x1 = c
+        while x1 > 0 and adjacent[r, x1 - 1] == 0 and not is_flagged[r, x1 - 1] and not expanded[r, x1 - 1]:
+            x1 -= 1
+        x2 = c
+        while x2 < cols - 1 and adjacent[r, x2 + 1] == 0 and not is_flagged[r, x2 + 1] and not expanded[r, x2 + 1]:
+            x2 += 1
+        for x in range(x1, x2 + 1):
+            expanded[r, x] = True
+
+        left, right = max(0, x1 - 1), min(cols, x2 + 2)
+        for y in range(max(0, r - 1), min(rows, r + 2)):
+            for x in range(left, right):
+                if not is_revealed[y, x] and not is_flagged[y, x]:
+                    is_revealed[y, x] = True
+                    revealed += 1
+
+        for y in (r - 1, r + 1):
+            if y < 0 or y >= rows:
+                continue
+            in_run = False
+            for x in range(left, right):
+                if adjacent[y, x] == 0 and not is_flagged[y, x] and not expanded[y, x]:
+                    if not in_run:
+                        stack[top] = y * cols + x
+                        top += 1
+                        in_run = True
+                else:
+                    in_run = False
+    return revealed
+
 
-class CellState:
-    """Mutable state of a single cell.
+@njit("void(boolean[:, :], uint8[:, :], int32[:, :])", cache=True)
+def _label_zero_regions(is_mine, adjacent, labels):
+    """Label the 8-connected regions of zero cells in `labels` (1, 2, ...).
 
-    Attributes:
-        is_mine: Whether this cell contains a mine.
-        is_revealed: Whether the cell has been revealed to the player.
-        is_flagged: Whether the player flagged this cell as a mine.
-        adjacent: Number of adjacent mines in the 8 neighboring cells.
+    Cells that are mines or have a nonzero count get label 0. Cells are
+    labeled as they are pushed, so each enters the stack at most once.
     """
+    rows, cols = adjacent.shape
+    labels[:, :] = 0
+    stack = np.empty(rows * cols, dtype=np.int32)
+    count = 0
+    for r0 in range(rows):
+        for c0 in range(cols):
+            if is_mine[r0, c0] or adjacent[r0, c0] != 0 or labels[r0, c0] != 0:
+                continue
+            count += 1
+            labels[r0, c0] = count
+            stack[0] = r0 * cols + c0
+            top = 1
+            while top > 0:
+                top -= 1
+                r = stack[top] // cols
+                c = stack[top] - r * cols
+                for y in range(max(0, r - 1), min(rows, r + 2)):
+                    for x in range(max(0, c - 1), min(cols, c + 2)):
+                        if labels[y, x] == 0 and adjacent[y, x] == 0 and not is_mine[y, x]:
+                            labels[y, x] = count
+                            stack[top] = y * cols + x
+                            top += 1
 
-    def __init__(self, is_mine: bool = False, is_revealed: bool = False, is_flagged: bool = False, adjacent: int = 0):
-        self.is_mine = is_mine
-        self.is_revealed = is_revealed
-        self.is_flagged = is_flagged
-        self.adjacent = adjacent
 
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Return `mask` grown by one cell in all 8 directions."""
+    rows, cols = mask.shape
+    out = mask.copy()
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr == 0 and dc == 0:
+                continue
+            out[max(0, -dr):rows - max(0, dr), max(0, -dc):cols - max(0, dc)] |= \
+                mask[max(0, dr):rows - max(0, -dr), max(0, dc):cols - max(0, -dc)]
+    return out
 
-class Cell:
-    """Logical cell positioned on the board by column and row."""
 
-    def __init__(self, col: int, row: int):
+class CellView:
+    """Read-only view of the cell at (col,row) on a Board.
+
+    Reads go straight to the board's arrays, so a view always reflects the
+    current state. Changes must go through Board methods (reveal,
+    toggle_flag), which keep the board's counters in sync.
+    """
+
+    __slots__ = ("board", "col", "row")
+
+    def __init__(self, board: "Board", col: int, row: int):
+        self.board = board
         self.col = col
         self.row = row
-        self.state = CellState()
+
+    @property
+    def is_mine(self) -> bool:
+        return bool(self.board.is_mine[self.row, self.col])
+
+    @property
+    def is_revealed(self) -> bool:
+        return bool(self.board.is_revealed[self.row, self.col])
+
+    @property
+    def is_flagged(self) -> bool:
+        return bool(self.board.is_flagged[self.row, self.col])
+
+    @property
+    def adjacent(self) -> int:
+        return int(self.board.adjacent[self.row, self.col])
 
 
 class Board:
@@ -48,117 +217,123 @@ class Board:
     Responsibilities:
     - Generate and place mines with first-click safety
     - Compute adjacency counts for every cell
-    - Reveal cells (iterative flood fill when adjacent == 0)
+    - Reveal cells (the whole zero region at once when adjacent == 0)
     - Toggle flags, check win/lose conditions
+
+    Per-cell state lives in four arrays of shape (rows, cols):
+    is_mine, is_revealed, is_flagged (bool) and adjacent (uint8).
     """
 
     def __init__(self, cols: int, rows: int, mines: int):
         self.cols = cols
         self.rows = rows
         self.num_mines = mines
-        self.cells: List[Cell] = [Cell(c, r) for r in range(rows) for c in range(cols)]
+        self.is_mine = np.zeros((rows, cols), dtype=bool)
+        self.is_revealed = np.zeros((rows, cols), dtype=bool)
+        self.is_flagged = np.zeros((rows, cols), dtype=bool)
+        self.adjacent = np.zeros((rows, cols), dtype=np.uint8)
+        self._zero_labels = np.zeros((rows, cols), dtype=np.int32)
+        self._rng = np.random.default_rng()
+        self._neighbor_idx, self._neighbor_count = _build_neighbor_table(cols, rows)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the board for a new game, reusing the existing arrays."""
+        self.is_mine.fill(False)
+        self.is_revealed.fill(False)
+        self.is_flagged.fill(False)
+        self.adjacent.fill(0)
+        self._zero_labels.fill(0)
+        self._flagged_count = 0
         self._mines_placed = False
         self.revealed_count = 0
         self.game_over = False
         self.win = False
 
     def index(self, col: int, row: int) -> int:
-        """Return the flat list index for (col,row)."""
+        """Return the flat (row-major) index for (col,row)."""
         return row * self.cols + col
 
     def is_inbounds(self, col: int, row: int) -> bool:
         return 0 <= col < self.cols and 0<= row < self.rows
 
+    def cell(self, col: int, row: int) -> CellView:
+        """Return a view of the cell at (col,row)."""
+        return CellView(self, col, row)
+
+    def neighbor_indices(self, col: int, row: int) -> np.ndarray:
+        """Return flat indices of the in-bounds neighbors of (col,row)."""
+        idx = self.index(col, row)
+        return self._neighbor_idx[idx, :self._neighbor_count[idx]]
+
     def neighbors(self, col: int, row: int) -> List[Tuple[int, int]]:
-        deltas = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0), (1, 0),
-            (-1, 1), (0, 1), (1, 1),
-        ]
-        result = []
-        for dc, dr in deltas:
-            new_col, new_row = col + dc, row + dr
-            if self.is_inbounds(new_col, new_row):
-                result.append((new_col, new_row))
-
-        return result
+        cols = self.cols
+        return [(n % cols, n // cols) for n in self.neighbor_indices(col, row).tolist()]
 
     def place_mines(self, safe_col: int, safe_row: int) -> None:
-        all_positions = [(c, r) for r in range(self.rows) for c in range(self.cols)]
-        forbidden = {(safe_col, safe_row)} | set(self.neighbors(safe_col, safe_row))
-        pool = [p for p in all_positions if p not in forbidden]
-        random.shuffle(pool)
-        mine_positions = pool[:self.num_mines]
-        for mc, mr in mine_positions:
-            idx = self.index(mc, mr)
-            self.cells[idx].state.is_mine = True
-        for r in range(self.rows):
-            for c in range(self.cols):
-                idx = self.index(c, r)
-                cell = self.cells[idx]
-
-                if not cell.state.is_mine:
-                    count = 0
-                    for nc, nr in self.neighbors(c, r):
-                        n_idx = self.index(nc, nr)
-                        if self.cells[n_idx].state.is_mine:
-                            count += 1
-                    cell.state.adjacent = count
+        forbidden = np.zeros(self.rows * self.cols, dtype=bool)
+        forbidden[self.index(safe_col, safe_row)] = True
+        forbidden[self.neighbor_indices(safe_col, safe_row)] = True
+        pool = np.flatnonzero(~forbidden)
+        picks = self._rng.choice(pool, size=min(self.num_mines, pool.size), replace=False)
+        self.is_mine.ravel()[picks] = True
+        _count_adjacent(self.is_mine, self.adjacent)
+        _label_zero_regions(self.is_mine, self.adjacent, self._zero_labels)
 
         self._mines_placed = True
 
     def reveal(self, col: int, row: int) -> None:
         if not self.is_inbounds(col, row):
             return
-        idx = self.index(col, row)
-        cell = self.cells[idx]
-        if cell.state.is_revealed or cell.state.is_flagged:
+        if self.is_revealed[row, col] or self.is_flagged[row, col]:
             return
         if not self._mines_placed:
             self.place_mines(col, row)
-        cell.state.is_revealed = True
+        self.is_revealed[row, col] = True
         self.revealed_count += 1
-        if cell.state.is_mine:
+        if self.is_mine[row, col]:
             self.game_over = True
             return
-        if cell.state.adjacent == 0:
-            stack = [(col, row)]
-            while stack:
-                curr_col, curr_row = stack.pop()
-                for n_col, n_row in self.neighbors(curr_col, curr_row):
-                    n_idx = self.index(n_col, n_row)
-                    n_cell = self.cells[n_idx]
-                    if not n_cell.state.is_revealed and not n_cell.state.is_flagged:
-                        n_cell.state.is_revealed = True
-                        self.revealed_count += 1
-                        if n_cell.state.adjacent == 0:
-                            stack.append((n_col, n_row))
+        if self.adjacent[row, col] == 0:
+            self._flood_reveal(col, row)
 
         self._check_win()
 
+    def _flood_reveal(self, col: int, row: int) -> None:
+        """Reveal the zero region containing (col,row) plus its numbered border.
+
+        Zero regions are labeled once in place_mines, so the opening is the
+        cell's region grown by one cell (its border holds no mines). A flag
+        inside the region can cut it in two, so in that case the scanline
+        fill is used to stop at the flag exactly as before.
+        """
+        region = self._zero_labels == self._zero_labels[row, col]
+        if (region & self.is_flagged).any():
+            self.revealed_count += _flood_fill(self.is_revealed, self.is_flagged, self.adjacent, col, row)
+            return
+        new = _dilate(region) & ~self.is_revealed & ~self.is_flagged
+        self.revealed_count += int(new.sum())
+        self.is_revealed |= new
+
     def toggle_flag(self, col: int, row: int) -> None:
         if not self.is_inbounds(col, row):
             return
-        idx = self.index(col, row)
-        cell = self.cells[idx]
-        if cell.state.is_revealed:
+        if self.is_revealed[row, col]:
             return
-        cell.state.is_flagged = not cell.state.is_flagged
+        flagged = not self.is_flagged[row, col]
+        self.is_flagged[row, col] = flagged
+        self._flagged_count += 1 if flagged else -1
 
     def flagged_count(self) -> int:
-        return sum(1 for cell in self.cells if cell.state.is_flagged)
+        return self._flagged_count
 
     def _reveal_all_mines(self) -> None:
         """Reveal all mines; called on game over."""
-        for cell in self.cells:
-            if cell.state.is_mine:
-                cell.state.is_revealed = True
+        self.is_revealed |= self.is_mine
 
     def _check_win(self) -> None:
         """Set win=True when all non-mine cells have been revealed."""
         total_cells = self.cols * self.rows
         if self.revealed_count == total_cells - self.num_mines and not self.game_over:
             self.win = True
-            for cell in self.cells:
-                if not cell.state.is_revealed and not cell.state.is_mine:
-                    cell.state.is_revealed = True
+            self.is_revealed |= ~self.is_mine
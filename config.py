@@ -66,6 +66,7 @@ font_name = None  # default pygame font
 font_size = 22
 header_font_size = 24
 result_font_size = 64
+text_cache_size = 128  # max cached header/result text surfaces
 
 # Input
 mouse_left = 1
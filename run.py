@@ -11,6 +11,7 @@ The logic lives in components.Board; this module should not implement rules.
 
 import sys
 
+import numpy as np
 import pygame
 
 import config
@@ -22,7 +23,9 @@ class Renderer:
     """Draws the Minesweeper UI.
 
     Knows how to draw individual cells with flags/numbers, header info,
-    and end-of-game overlays with a semi-transparent background.
+    and end-of-game overlays with a semi-transparent background. Cells are
+    painted onto an off-screen grid surface that is blitted to the screen
+    in one piece.
     """
 
     def __init__(self, screen: pygame.Surface, board: Board):
@@ -31,6 +34,26 @@ class Renderer:
         self.font = pygame.font.Font(config.font_name, config.font_size)
         self.header_font = pygame.font.Font(config.font_name, config.header_font_size)
         self.result_font = pygame.font.Font(config.font_name, config.result_font_size)
+        self._num_surfs = {
+            n: self.font.render(str(n), True, config.number_colors.get(n, config.color_text))
+            for n in range(1, 9)
+        }
+        self._num_rects = {n: surf.get_rect() for n, surf in self._num_surfs.items()}
+        self._text_cache: dict[tuple[pygame.font.Font, str, tuple], pygame.Surface] = {}
+        self._overlay_surf: pygame.Surface | None = None
+        self._overlay_size = (0, 0)
+        self._build_grid()
+
+    def _build_grid(self) -> None:
+        """Create the grid surface and precompute cell rects, indexed [row][col].
+
+        `_rects` are relative to the grid surface, `_screen_rects` to the screen.
+        """
+        cols, rows, size = self.board.cols, self.board.rows, config.cell_size
+        self._grid_surf = pygame.Surface((cols * size, rows * size))
+        self._grid_pos = (config.margin_left, config.margin_top)
+        self._rects = [[Rect(c * size, r * size, size, size) for c in range(cols)] for r in range(rows)]
+        self._screen_rects = [[self.cell_rect(c, r) for c in range(cols)] for r in range(rows)]
 
     def cell_rect(self, col: int, row: int) -> Rect:
         """Return the rectangle in pixels for the given grid cell."""
@@ -38,30 +61,46 @@ class Renderer:
         y = config.margin_top + row * config.cell_size
         return Rect(x, y, config.cell_size, config.cell_size)
 
-    def draw_cell(self, col: int, row: int, highlighted: bool) -> None:
-        """Draw a single cell, respecting revealed/flagged state and highlight."""
-        cell = self.board.cells[self.board.index(col, row)]
-        rect = self.cell_rect(col, row)
-        if cell.state.is_revealed:
-            pygame.draw.rect(self.screen, config.color_cell_revealed, rect)
-            if cell.state.is_mine:
-                pygame.draw.circle(self.screen, config.color_cell_mine, rect.center, rect.width // 4)
-            elif cell.state.adjacent > 0:
-                color = config.number_colors.get(cell.state.adjacent, config.color_text)
-                label = self.font.render(str(cell.state.adjacent), True, color)
-                label_rect = label.get_rect(center=rect.center)
-                self.screen.blit(label, label_rect)
+    def _render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text through a small FIFO cache keyed by (font, text, color)."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(self._text_cache) >= config.text_cache_size:
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[key] = surf
+        return surf
+
+    def draw_cell(self, col: int, row: int, highlighted: bool) -> Rect:
+        """Draw a single cell, respecting revealed/flagged state and highlight.
+
+        The cell is painted on the grid surface; it reaches the screen with
+        the next blit_grid(). Returns the cell's screen rect.
+        """
+        board = self.board
+        surf = self._grid_surf
+        rect = self._rects[row][col]
+        if board.is_revealed[row, col]:
+            pygame.draw.rect(surf, config.color_cell_revealed, rect)
+            adjacent = int(board.adjacent[row, col])
+            if board.is_mine[row, col]:
+                pygame.draw.circle(surf, config.color_cell_mine, rect.center, rect.width // 4)
+            elif adjacent > 0:
+                label_rect = self._num_rects[adjacent]
+                label_rect.center = rect.center
+                surf.blit(self._num_surfs[adjacent], label_rect)
         else:
             base_color = config.color_highlight if highlighted else config.color_cell_hidden
-            pygame.draw.rect(self.screen, base_color, rect)
-            if cell.state.is_flagged:
+            pygame.draw.rect(surf, base_color, rect)
+            if board.is_flagged[row, col]:
                 flag_w = max(6, rect.width // 3)
                 flag_h = max(8, rect.height // 2)
                 pole_x = rect.left + rect.width // 3
                 pole_y = rect.top + 4
-                pygame.draw.line(self.screen, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
+                pygame.draw.line(surf, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
                 pygame.draw.polygon(
-                    self.screen,
+                    surf,
                     config.color_flag,
                     [
                         (pole_x + 2, pole_y),
@@ -69,30 +108,39 @@ class Renderer:
                         (pole_x + 2, pole_y + flag_h // 2),
                     ],
                 )
-        pygame.draw.rect(self.screen, config.color_grid, rect, 1)
-
-    def draw_header(self, remaining_mines: int, time_text: str) -> None:
-        """Draw the header bar containing remaining mines and elapsed time."""
-        pygame.draw.rect(
-            self.screen,
-            config.color_header,
-            Rect(0, 0, config.width, config.margin_top - 4),
-        )
+        pygame.draw.rect(surf, config.color_grid, rect, 1)
+        return self._screen_rects[row][col]
+
+    def blit_grid(self) -> None:
+        """Copy the grid surface to its place on the screen."""
+        self.screen.blit(self._grid_surf, self._grid_pos)
+
+    def draw_header(self, remaining_mines: int, time_text: str) -> Rect:
+        """Draw the header bar containing remaining mines and elapsed time.
+
+        Returns the screen rect that was painted.
+        """
+        header_rect = Rect(0, 0, config.width, config.margin_top - 4)
+        pygame.draw.rect(self.screen, config.color_header, header_rect)
         left_text = f"Mines: {remaining_mines}"
         right_text = f"Time: {time_text}"
-        left_label = self.header_font.render(left_text, True, config.color_header_text)
-        right_label = self.header_font.render(right_text, True, config.color_header_text)
+        left_label = self._render(self.header_font, left_text, config.color_header_text)
+        right_label = self._render(self.header_font, right_text, config.color_header_text)
         self.screen.blit(left_label, (10, 12))
         self.screen.blit(right_label, (config.width - right_label.get_width() - 10, 12))
+        return header_rect
 
     def draw_result_overlay(self, text: str | None) -> None:
         """Draw a semi-transparent overlay with centered result text, if any."""
         if not text:
             return
-        overlay = pygame.Surface((config.width, config.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, config.result_overlay_alpha))
-        self.screen.blit(overlay, (0, 0))
-        label = self.result_font.render(text, True, config.color_result)
+        size = self.screen.get_size()
+        if self._overlay_surf is None or size != self._overlay_size:
+            self._overlay_surf = pygame.Surface(size, pygame.SRCALPHA)
+            self._overlay_surf.fill((0, 0, 0, config.result_overlay_alpha))
+            self._overlay_size = size
+        self.screen.blit(self._overlay_surf, (0, 0))
+        label = self._render(self.result_font, text, config.color_result)
         rect = label.get_rect(center=(config.width // 2, config.height // 2))
         self.screen.blit(label, rect)
 
@@ -103,41 +151,36 @@ class InputController:
     def __init__(self, game: "Game"):
         self.game = game
 
-    def pos_to_grid(self, x: int, y: int):
-        """Convert pixel coordinates to (col,row) grid indices or (-1,-1) if out of bounds."""
-        if not (config.margin_left <= x < config.width - config.margin_right):
-            return -1, -1
-        if not (config.margin_top <= y < config.height - config.margin_bottom):
-            return -1, -1
+    def pos_to_grid(self, x: int, y: int) -> tuple[int, int] | None:
+        """Convert pixel coordinates to (col,row) grid indices, or None if off the grid."""
         col = (x - config.margin_left) // config.cell_size
         row = (y - config.margin_top) // config.cell_size
         if 0 <= col < self.game.board.cols and 0 <= row < self.game.board.rows:
             return int(col), int(row)
-        return -1, -1
+        return None
 
     def handle_mouse(self, pos, button) -> None:
-        col, row = self.pos_to_grid(pos[0], pos[1])
-        if col == -1:
+        grid_pos = self.pos_to_grid(pos[0], pos[1])
+        if grid_pos is None:
             return
+        col, row = grid_pos
         game = self.game
         if button == config.mouse_left:
-            game.highlight_targets.clear()
+            game.highlight_mask.fill(False)
             if not game.started:
                 game.started = True
                 game.start_ticks_ms = pygame.time.get_ticks()
             game.board.reveal(col, row)
 
         elif button == config.mouse_right:
-            game.highlight_targets.clear()
+            game.highlight_mask.fill(False)
             game.board.toggle_flag(col, row)
 
         elif button == config.mouse_middle:
-            neighbors = game.board.neighbors(col, row)
-            game.highlight_targets = {
-                (nc, nr)
-                for (nc, nr) in neighbors
-                if not game.board.cells[game.board.index(nc, nr)].state.is_revealed
-            }
+            board = game.board
+            neighbors = board.neighbor_indices(col, row)
+            game.highlight_mask.fill(False)
+            game.highlight_mask.ravel()[neighbors] = ~board.is_revealed.ravel()[neighbors]
 
             game.highlight_until_ms = pygame.time.get_ticks() + config.highlight_duration_ms
 
@@ -154,21 +197,32 @@ class Game:
         self.board = Board(config.cols, config.rows, config.num_mines)
         self.renderer = Renderer(self.screen, self.board)
         self.input = InputController(self)
-        self.highlight_targets = set()
+        self.highlight_mask = np.zeros((self.board.rows, self.board.cols), dtype=bool)
         self.highlight_until_ms = 0
         self.started = False
         self.start_ticks_ms = 0
         self.end_ticks_ms = 0
+        self._last_time_sec = -1
+        self._time_text = ""
+        # What is currently on screen; draw() repaints only what differs.
+        self._needs_redraw = True
+        self._full_redraw = True
+        self._shown_revealed = self.board.is_revealed.copy()
+        self._shown_flagged = self.board.is_flagged.copy()
+        self._shown_highlight = self.highlight_mask.copy()
+        self._shown_header = None
+        self._shown_result = None
 
     def reset(self):
         """Reset the game state and start a new board."""
-        self.board = Board(config.cols, config.rows, config.num_mines)
-        self.renderer.board = self.board
-        self.highlight_targets.clear()
+        self.board.reset()
+        self.highlight_mask.fill(False)
         self.highlight_until_ms = 0
         self.started = False
         self.start_ticks_ms = 0
         self.end_ticks_ms = 0
+        self._needs_redraw = True
+        self._full_redraw = True
 
     def _elapsed_ms(self) -> int:
         """Return elapsed time in milliseconds (stops when game ends)."""
@@ -193,25 +247,104 @@ class Game:
             return "GAME CLEAR"
         return None
 
+    def _dirty_cells(self) -> list:
+        """Return (col,row) of cells whose drawn state differs from the screen."""
+        board = self.board
+        changed = (
+            (board.is_revealed != self._shown_revealed)
+            | (board.is_flagged != self._shown_flagged)
+            | (self.highlight_mask != self._shown_highlight)
+        )
+        rows, cols = np.nonzero(changed)
+        return list(zip(cols.tolist(), rows.tolist()))
+
     def draw(self):
-        """Render one frame: header, grid, result overlay."""
-        if pygame.time.get_ticks() > self.highlight_until_ms and self.highlight_targets:
-            self.highlight_targets.clear()
-        self.screen.fill(config.color_bg)
-        remaining = max(0, config.num_mines - self.board.flagged_count())
-        time_text = self._format_time(self._elapsed_ms())
-        self.renderer.draw_header(remaining, time_text)
-        now = pygame.time.get_ticks()
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                highlighted = (now <= self.highlight_until_ms) and ((c, r) in self.highlight_targets)
-                self.renderer.draw_cell(c, r, highlighted)
-        self.renderer.draw_result_overlay(self._result_text())
-        pygame.display.flip()
+        """Render one frame: header, grid, result overlay.
+
+        Only cells and header text that changed since the previous frame are
+        repainted, onto the renderer's grid surface. Every cell is repainted
+        on the first frame and after a reset; the whole screen is recomposed
+        from the grid surface whenever the result overlay is (or would be)
+        affected.
+        """
+        self._needs_redraw = False
+        highlighted = self.highlight_mask
+        if pygame.time.get_ticks() > self.highlight_until_ms and highlighted.any():
+            highlighted.fill(False)
+        board = self.board
+        remaining = max(0, config.num_mines - board.flagged_count())
+        sec = self._elapsed_ms() // 1000
+        if sec != self._last_time_sec:
+            self._last_time_sec = sec
+            self._time_text = self._format_time(sec * 1000)
+        header = (remaining, self._time_text)
+        result = self._result_text()
+        dirty = self._dirty_cells()
+
+        if self._full_redraw:
+            dirty = [(c, r) for r in range(board.rows) for c in range(board.cols)]
+
+        if self._full_redraw or result != self._shown_result or (result and dirty):
+            self.screen.fill(config.color_bg)
+            self.renderer.draw_header(*header)
+            for c, r in dirty:
+                self.renderer.draw_cell(c, r, highlighted[r, c])
+            self.renderer.blit_grid()
+            self.renderer.draw_result_overlay(result)
+            pygame.display.update()
+        elif dirty or header != self._shown_header:
+            dirty_rects = []
+            if header != self._shown_header:
+                dirty_rects.append(self.renderer.draw_header(*header))
+            for c, r in dirty:
+                dirty_rects.append(self.renderer.draw_cell(c, r, highlighted[r, c]))
+            if dirty:
+                self.renderer.blit_grid()
+            pygame.display.update(dirty_rects)
+        else:
+            return
+
+        self._full_redraw = False
+        self._shown_revealed = board.is_revealed.copy()
+        self._shown_flagged = board.is_flagged.copy()
+        self._shown_highlight = highlighted.copy()
+        self._shown_header = header
+        self._shown_result = result
+
+    def _next_wake_ms(self) -> int:
+        """Return ms until the screen changes on its own, or 0 if it never will.
+
+        The running timer needs a redraw at each second boundary and an
+        active highlight needs one when it expires; otherwise the frame only
+        changes in response to input.
+        """
+        waits = []
+        if self.started and not self.end_ticks_ms:
+            waits.append(1000 - self._elapsed_ms() % 1000)
+        if self.highlight_mask.any():
+            waits.append(self.highlight_until_ms - pygame.time.get_ticks() + 1)
+        if not waits:
+            return 0
+        return max(1, min(waits))
+
+    def _check_timed_changes(self) -> None:
+        """Request a redraw when the timer second rolls over or the highlight expires."""
+        if self._elapsed_ms() // 1000 != self._last_time_sec:
+            self._needs_redraw = True
+        if pygame.time.get_ticks() > self.highlight_until_ms and self.highlight_mask.any():
+            self._needs_redraw = True
 
     def run_step(self) -> bool:
-        """Process inputs, update time, draw, and tick the clock once."""
-        for event in pygame.event.get():
+        """Wait for input or the next timed change, then process and draw.
+
+        Blocks in pygame.event.wait instead of polling, so an idle board
+        wakes about once per second while the timer runs and not at all
+        otherwise. The clock tick still caps the rate under input floods.
+        Nothing is drawn unless input, a timed change or a window expose
+        asked for it, so a finished game stays idle.
+        """
+        first = pygame.event.wait(self._next_wake_ms())
+        for event in [first, *pygame.event.get()]:
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.KEYDOWN:
@@ -219,9 +352,15 @@ class Game:
                     self.reset()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 self.input.handle_mouse(event.pos, event.button)
+                self._needs_redraw = True
+            if event.type == pygame.WINDOWEXPOSED:
+                self._needs_redraw = True
+                self._full_redraw = True
         if (self.board.game_over or self.board.win) and self.started and not self.end_ticks_ms:
             self.end_ticks_ms = pygame.time.get_ticks()
-        self.draw()
+        self._check_timed_changes()
+        if self._needs_redraw:
+            self.draw()
         self.clock.tick(config.fps)
         return True
 